@@ -4,12 +4,14 @@ This module provides an API client for communicating with Emaux SPV pool pumps o
 It enables getting pump data, setting speeds, and controlling power state.
 """
 
+import asyncio
 import logging
-import math
-from typing import Any
+from time import time_ns
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import aiohttp
-from datetime import datetime, timezone
+import msgspec
+import orjson
 from aiohttp import ClientTimeout
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,9 +19,81 @@ _LOGGER = logging.getLogger(__name__)
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+# Source templates for reading one raw value, keyed by field type. Struct
+# ints are already coerced by msgspec; strings and flags are read as sent so
+# both builders accept the same payloads.
+_DICT_CONVERTERS = {
+    str: "d[%r]",
+    int: "int(d[%r])",
+    bool: 'd[%r] == "1"',
+}
+_STRUCT_CONVERTERS = {
+    str: "d.%s",
+    int: "d.%s",
+    bool: 'd.%s == "1"',
+}
+# msgspec field type for each field type; str and flag values pass through
+# unchanged, matching the plain d[key] reads in from_dict
+_STRUCT_TYPES = {str: Any, int: int, bool: Any}
+
+def _leaves(spec: Any) -> Iterator[tuple[str, type]]:
+    """Yield every (response key, type) pair in a field spec."""
+    if isinstance(spec, dict):
+        for field in spec.values():
+            yield from _leaves(field)
+    elif isinstance(spec, list):
+        for item in spec:
+            yield from _leaves(item)
+    elif isinstance(spec[0], type):
+        yield from _leaves(spec[1])
+    else:
+        yield spec
+
+def _render(spec: Any, converters: dict[type, str], namespace: dict[str, Any]) -> str:
+    """Return the source expression building one field spec.
+
+    Nested dataclasses are added to ``namespace`` so the generated code can
+    reference them by name.
+    """
+    if isinstance(spec, dict):
+        return ", ".join(f"{name}={_render(field, converters, namespace)}" for name, field in spec.items())
+    if isinstance(spec, list):
+        return "[%s]" % ", ".join(_render(item, converters, namespace) for item in spec)
+    if isinstance(spec[0], type):
+        namespace[spec[0].__name__] = spec[0]
+        return f"{spec[0].__name__}({_render(spec[1], converters, namespace)})"
+    key, kind = spec
+    return converters[kind] % key
+
+def _compile_builders(cls: type, fields: dict[str, Any]) -> None:
+    """Generate and attach from_dict and from_json classmethods for fields."""
+    raw = msgspec.defstruct(
+        f"_{cls.__name__}Raw", [(key, _STRUCT_TYPES[kind]) for key, kind in _leaves(fields)], gc=False
+    )
+    namespace = {"_decode": msgspec.json.Decoder(raw, strict=False).decode}
+    exec(
+        f"def from_dict(cls, d):\n"
+        f"    return cls({_render(fields, _DICT_CONVERTERS, namespace)})\n"
+        f"def from_json(cls, body, _decode=_decode):\n"
+        f"    d = _decode(body)\n"
+        f"    return cls({_render(fields, _STRUCT_CONVERTERS, namespace)})\n",
+        namespace
+    )
+    for name, doc in (
+        ("from_dict", "Create instance from dictionary."),
+        ("from_json", "Create instance from a raw JSON response body."),
+    ):
+        builder = namespace[name]
+        builder.__doc__ = doc
+        builder.__qualname__ = f"{cls.__qualname__}.{name}"
+        setattr(cls, name, classmethod(builder))
+
+@dataclass(slots=True)
 class EmauxPumpData:
-    """Data class for Emaux pump data."""
+    """Data class for Emaux pump data.
+
+    ``from_dict`` and ``from_json`` are generated from ``_PUMP_FIELDS``.
+    """
     current_time: str
     current_speed: int
     current_watts: int
@@ -35,27 +109,15 @@ class EmauxPumpData:
     schedule_count: int
     model: str
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "EmauxPumpData":
-        """Create instance from dictionary."""
-        return cls(
-            current_time=data["CurrentTime"],
-            current_speed=int(data["CurrentSpeed"]),
-            current_watts=int(data["CurrentWatts"]),
-            running_status=data["RunningStatus"] == "1",
-            fault_flag=int(data["FaultFlag"]),
-            fault_code=data["FaultCode"],
-            speed_selected=int(data["SpeedSelected"]),
-            current_temperature=int(data["CurrentTemperuture"]),  # Note: API has typo in 'Temperature'
-            free_mode_status=data["FreeModeStatus"] == "1",
-            current_schedule=int(data["CurrentSchedule"]),
-            current_gpm=int(data["CurrentGPM"]),
-            speed_count=int(data["SpeedCount"]),
-            schedule_count=int(data["ScheduleCount"]),
-            model=data["Model"]
-        )
+    if TYPE_CHECKING:
+        # Generated by _compile_builders; declared here for type checkers
+        @classmethod
+        def from_dict(cls, data: dict) -> "EmauxPumpData": ...
 
-@dataclass
+        @classmethod
+        def from_json(cls, body: bytes) -> "EmauxPumpData": ...
+
+@dataclass(slots=True)
 class Schedule:
     """Data class for schedule settings."""
     enabled: bool
@@ -66,9 +128,33 @@ class Schedule:
     speed_select: int
     title: str
 
-@dataclass
+# Response keys for the four speed presets and schedules
+_SPEED_KEYS = tuple((f"Speed{i}", f"Speed{i}Title") for i in range(1, 5))
+_SCHED_KEYS = tuple(
+    (
+        f"Sch{i}En", f"Sch{i}TimeOnHour", f"Sch{i}TimeOnMin", f"Sch{i}TimeOffHour",
+        f"Sch{i}TimeOffMin", f"Sch{i}SpeedSelect", f"SchTitle{i}"
+    )
+    for i in range(1, 5)
+)
+
+# Schedule fields and types, in the same order as each _SCHED_KEYS entry
+_SCHEDULE_FIELDS = (
+    ("enabled", bool),
+    ("time_on_hour", int),
+    ("time_on_min", int),
+    ("time_off_hour", int),
+    ("time_off_min", int),
+    ("speed_select", int),
+    ("title", str),
+)
+
+@dataclass(slots=True)
 class EmauxPumpSettings:
-    """Data class for Emaux pump settings."""
+    """Data class for Emaux pump settings.
+
+    ``from_dict`` and ``from_json`` are generated from ``_SETTINGS_FIELDS``.
+    """
     current_min: int
     current_hour: int
     run_stop: bool
@@ -86,220 +172,360 @@ class EmauxPumpSettings:
     wifi_set_to_default: bool
     reset: bool
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "EmauxPumpSettings":
-        """Create instance from dictionary."""
-        # Process speeds and titles
-        speeds = [
-            int(data["Speed1"]), int(data["Speed2"]),
-            int(data["Speed3"]), int(data["Speed4"])
-        ]
-        speed_titles = [
-            data["Speed1Title"], data["Speed2Title"],
-            data["Speed3Title"], data["Speed4Title"]
-        ]
-
-        # Process schedules
-        schedules = []
-        for i in range(1, 5):
-            schedule = Schedule(
-                enabled=data[f"Sch{i}En"] == "1",
-                time_on_hour=int(data[f"Sch{i}TimeOnHour"]),
-                time_on_min=int(data[f"Sch{i}TimeOnMin"]),
-                time_off_hour=int(data[f"Sch{i}TimeOffHour"]),
-                time_off_min=int(data[f"Sch{i}TimeOffMin"]),
-                speed_select=int(data[f"Sch{i}SpeedSelect"]),
-                title=data[f"SchTitle{i}"]
-            )
-            schedules.append(schedule)
-
-        return cls(
-            current_min=int(data["CurrentMin"]),
-            current_hour=int(data["CurrentHour"]),
-            run_stop=data["RunStop"] == "1",
-            set_current_speed=int(data["SetCurrentSpeed"]),
-            set_speed_selected=int(data["SetSpeedSelected"]),
-            speeds=speeds,
-            speed_titles=speed_titles,
-            schedules=schedules,
-            language=int(data["Language"]),
-            lang_sel=data["LangSel"],
-            frozen_enable=data["Frozen_Enable"] == "1",
-            frozen_lasting_time=int(data["Frozen_LastingTime"]),
-            frozen_speed=int(data["Frozen_Speed"]),
-            frozen_temperature=int(data["Frozen_Temperature"]),
-            wifi_set_to_default=data["WifiSetToDefault"] == "1",
-            reset=data["Reset"] == "1"
-        )
-@dataclass
+    if TYPE_CHECKING:
+        # Generated by _compile_builders; declared here for type checkers
+        @classmethod
+        def from_dict(cls, data: dict) -> "EmauxPumpSettings": ...
+
+        @classmethod
+        def from_json(cls, body: bytes) -> "EmauxPumpSettings": ...
+
+# Field specs map each attribute to a (response key, type) pair, a list of
+# specs, or a (dataclass, fields) pair for a nested dataclass
+_PUMP_FIELDS = {
+    "current_time": ("CurrentTime", str),
+    "current_speed": ("CurrentSpeed", int),
+    "current_watts": ("CurrentWatts", int),
+    "running_status": ("RunningStatus", bool),
+    "fault_flag": ("FaultFlag", int),
+    "fault_code": ("FaultCode", str),
+    "speed_selected": ("SpeedSelected", int),
+    "current_temperature": ("CurrentTemperuture", int),  # Note: API has typo in 'Temperature'
+    "free_mode_status": ("FreeModeStatus", bool),
+    "current_schedule": ("CurrentSchedule", int),
+    "current_gpm": ("CurrentGPM", int),
+    "speed_count": ("SpeedCount", int),
+    "schedule_count": ("ScheduleCount", int),
+    "model": ("Model", str),
+}
+
+_SETTINGS_FIELDS = {
+    "current_min": ("CurrentMin", int),
+    "current_hour": ("CurrentHour", int),
+    "run_stop": ("RunStop", bool),
+    "set_current_speed": ("SetCurrentSpeed", int),
+    "set_speed_selected": ("SetSpeedSelected", int),
+    "speeds": [(key, int) for key, _ in _SPEED_KEYS],
+    "speed_titles": [(key, str) for _, key in _SPEED_KEYS],
+    "schedules": [
+        (Schedule, {name: (key, kind) for (name, kind), key in zip(_SCHEDULE_FIELDS, keys)})
+        for keys in _SCHED_KEYS
+    ],
+    "language": ("Language", int),
+    "lang_sel": ("LangSel", str),
+    "frozen_enable": ("Frozen_Enable", bool),
+    "frozen_lasting_time": ("Frozen_LastingTime", int),
+    "frozen_speed": ("Frozen_Speed", int),
+    "frozen_temperature": ("Frozen_Temperature", int),
+    "wifi_set_to_default": ("WifiSetToDefault", bool),
+    "reset": ("Reset", bool),
+}
+
+_compile_builders(EmauxPumpData, _PUMP_FIELDS)
+_compile_builders(EmauxPumpSettings, _SETTINGS_FIELDS)
+
+@dataclass(slots=True)
 class EmauxData:
     """Data class for Emaux data."""
     pump: EmauxPumpData
     settings: EmauxPumpSettings
 
-# Valid parameters and their value ranges
+# Valid parameters and their value ranges, tagged by kind:
+# ("range", min, max), ("enum", choices) or ("str",)
 VALID_PARAMETERS = {
     # Basic Operation
-    "RunStop": (1, 2),  # Off/On
-    "SetCurrentSpeed": (800, 3400),  # Min/Max speed
-    "SetSpeedSelected": (1, 4),  # Speed presets 1-4
+    "RunStop": ("range", 1, 2),  # Off/On
+    "SetCurrentSpeed": ("range", 800, 3400),  # Min/Max speed
+    "SetSpeedSelected": ("range", 1, 4),  # Speed presets 1-4
     
     # Speed Presets
-    "Speed1": (800, 3400),
-    "Speed2": (800, 3400),
-    "Speed3": (800, 3400),
-    "Speed4": (800, 3400),
+    "Speed1": ("range", 800, 3400),
+    "Speed2": ("range", 800, 3400),
+    "Speed3": ("range", 800, 3400),
+    "Speed4": ("range", 800, 3400),
     
     # Speed Titles
-    "Speed1Title": None,  # String value
-    "Speed2Title": None,  # String value
-    "Speed3Title": None,  # String value
-    "Speed4Title": None,  # String value
+    "Speed1Title": ("str",),  # String value
+    "Speed2Title": ("str",),  # String value
+    "Speed3Title": ("str",),  # String value
+    "Speed4Title": ("str",),  # String value
     
     # Schedule Enables
-    "Sch1En": (0, 1),
-    "Sch2En": (0, 1),
-    "Sch3En": (0, 1),
-    "Sch4En": (0, 1),
+    "Sch1En": ("range", 0, 1),
+    "Sch2En": ("range", 0, 1),
+    "Sch3En": ("range", 0, 1),
+    "Sch4En": ("range", 0, 1),
     
     # Schedule Times
-    "Sch1TimeOnHour": (0, 23),
-    "Sch2TimeOnHour": (0, 23),
-    "Sch3TimeOnHour": (0, 23),
-    "Sch4TimeOnHour": (0, 23),
-    "Sch1TimeOnMin": (0, 59),
-    "Sch2TimeOnMin": (0, 59),
-    "Sch3TimeOnMin": (0, 59),
-    "Sch4TimeOnMin": (0, 59),
-    "Sch1TimeOffHour": (0, 23),
-    "Sch2TimeOffHour": (0, 23),
-    "Sch3TimeOffHour": (0, 23),
-    "Sch4TimeOffHour": (0, 23),
-    "Sch1TimeOffMin": (0, 59),
-    "Sch2TimeOffMin": (0, 59),
-    "Sch3TimeOffMin": (0, 59),
-    "Sch4TimeOffMin": (0, 59),
+    "Sch1TimeOnHour": ("range", 0, 23),
+    "Sch2TimeOnHour": ("range", 0, 23),
+    "Sch3TimeOnHour": ("range", 0, 23),
+    "Sch4TimeOnHour": ("range", 0, 23),
+    "Sch1TimeOnMin": ("range", 0, 59),
+    "Sch2TimeOnMin": ("range", 0, 59),
+    "Sch3TimeOnMin": ("range", 0, 59),
+    "Sch4TimeOnMin": ("range", 0, 59),
+    "Sch1TimeOffHour": ("range", 0, 23),
+    "Sch2TimeOffHour": ("range", 0, 23),
+    "Sch3TimeOffHour": ("range", 0, 23),
+    "Sch4TimeOffHour": ("range", 0, 23),
+    "Sch1TimeOffMin": ("range", 0, 59),
+    "Sch2TimeOffMin": ("range", 0, 59),
+    "Sch3TimeOffMin": ("range", 0, 59),
+    "Sch4TimeOffMin": ("range", 0, 59),
     
     # Schedule Speed Selections
-    "Sch1SpeedSelect": (1, 4),
-    "Sch2SpeedSelect": (1, 4),
-    "Sch3SpeedSelect": (1, 4),
-    "Sch4SpeedSelect": (1, 4),
+    "Sch1SpeedSelect": ("range", 1, 4),
+    "Sch2SpeedSelect": ("range", 1, 4),
+    "Sch3SpeedSelect": ("range", 1, 4),
+    "Sch4SpeedSelect": ("range", 1, 4),
     
     # Schedule Titles
-    "SchTitle1": None,  # String value
-    "SchTitle2": None,  # String value
-    "SchTitle3": None,  # String value
-    "SchTitle4": None,  # String value
+    "SchTitle1": ("str",),  # String value
+    "SchTitle2": ("str",),  # String value
+    "SchTitle3": ("str",),  # String value
+    "SchTitle4": ("str",),  # String value
     
     # Freeze Protection
-    "Frozen_Enable": (0, 1),
-    "Frozen_LastingTime": (1, 12),  # Hours
-    "Frozen_Speed": (1200, 3450),
-    "Frozen_Temperature": (2, 10),  # Celsius
+    "Frozen_Enable": ("range", 0, 1),
+    "Frozen_LastingTime": ("range", 1, 12),  # Hours
+    "Frozen_Speed": ("range", 1200, 3450),
+    "Frozen_Temperature": ("range", 2, 10),  # Celsius
     
     # System Settings
-    "Language": (0),  # Assuming 6 language options
-    "LangSel": {"en", "cn", "fr", "de", "es", "it", "ru"},  # String value
-    "WifiSetToDefault": (0, 1),
-    "Reset": (0, 1)
+    "Language": ("range", 0, 6),  # Index of one of the 7 LangSel options
+    "LangSel": ("enum", frozenset({"en", "cn", "fr", "de", "es", "it", "ru"})),  # String value
+    "WifiSetToDefault": ("range", 0, 1),
+    "Reset": ("range", 0, 1)
 }
 
+def _range_validator(name: str, min_val: int, max_val: int) -> Callable[[Any], None]:
+    """Build a validator for an inclusive numeric range."""
+    def validate(value: Any) -> None:
+        if not min_val <= value <= max_val:
+            raise ValueError(f"Invalid value for {name}: {value}. Must be between {min_val} and {max_val}")
+    return validate
+
+def _choice_validator(name: str, choices: frozenset) -> Callable[[Any], None]:
+    """Build a validator for a fixed set of values."""
+    def validate(value: Any) -> None:
+        if value not in choices:
+            raise ValueError(f"Invalid value for {name}: {value}. Must be one of {sorted(choices)}")
+    return validate
+
+def _str_validator(name: str) -> Callable[[Any], None]:
+    """Build a validator for a free-form string value."""
+    def validate(value: Any) -> None:
+        if not isinstance(value, str):
+            raise ValueError(f"Invalid value for {name}: {value}. Must be a string")
+    return validate
+
+def _build_validator(name: str, param_range: tuple) -> Callable[[Any], None]:
+    """Build the validator for a VALID_PARAMETERS entry."""
+    tag, *rest = param_range
+    if tag == "range":
+        return _range_validator(name, *rest)
+    if tag == "enum":
+        return _choice_validator(name, *rest)
+    if tag == "str":
+        return _str_validator(name)
+    raise ValueError(f"Invalid parameter range definition for {name}")
+
+_VALIDATORS: dict[str, Callable[[Any], None]] = {
+    name: _build_validator(name, param_range) for name, param_range in VALID_PARAMETERS.items()
+}
+
+def _validate(name: str, value: Any) -> None:
+    """Raise ValueError if value is not valid for parameter name."""
+    try:
+        validate = _VALIDATORS[name]
+    except KeyError:
+        raise ValueError(f"Invalid parameter: {name}") from None
+    validate(value)
+
+async def _read_small(response: aiohttp.ClientResponse) -> bytes:
+    """Read a small response body in one call sized by Content-Length."""
+    length = response.content_length
+    # Compressed bodies are decoded on the fly, so their length is unknown
+    if length is None or aiohttp.hdrs.CONTENT_ENCODING in response.headers:
+        return await response.read()
+    try:
+        return await response.content.readexactly(length)
+    except asyncio.IncompleteReadError as err:
+        raise aiohttp.ClientPayloadError("Response body shorter than Content-Length") from err
+
+def _echo_bytes(key: str, value: Any) -> bytes:
+    """Return the compact echo the pump sends after setting key to value."""
+    return b'{"%s":%s}' % (key.encode(), orjson.dumps(value))
+
+# Expected echoes for the fixed RunStop requests
+_ECHO_ON = _echo_bytes("RunStop", 1)
+_ECHO_OFF = _echo_bytes("RunStop", 2)
+
+def _expect_echo(body: bytes, key: str, value: Any, expected: bytes | None = None) -> bool:
+    """Check that a response body echoes back a single key and value.
+
+    ``expected`` may pass a precomputed ``_echo_bytes(key, value)``.
+    """
+    if expected is None:
+        expected = _echo_bytes(key, value)
+    if body == expected or body.strip() == expected:
+        return True
+    # Fall back to a full decode in case the pump formats its reply differently
+    try:
+        return orjson.loads(body) == {key: value}
+    except orjson.JSONDecodeError:
+        return False
+
+def _from_json(cls: Any, body: bytes) -> Any:
+    """Build a model from a response body, raising the library's error on bad data."""
+    try:
+        return cls.from_json(body)
+    except msgspec.DecodeError as err:
+        raise APIConnectionError("Invalid response from api") from err
+
+def _utc_now_ms(_time_ns: Callable[[], int] = time_ns) -> int:
+    """Return the current UTC time in milliseconds for request timestamps."""
+    return _time_ns() // 1_000_000
+
+# Path of the pump's CGI endpoint, relative to the session base URL
+_CGI_PATH = "/cgi-bin/EpvCgi"
+# Connections kept open to the pump; requests beyond this wait their turn
+_MAX_CONNECTIONS = 2
+
 class API:
-    """Class for example API."""
+    """Class for example API.
+
+    ``timeout`` is the total budget in seconds for one request. The TCP
+    handshake with the pump is capped at two seconds (or ``timeout`` if
+    lower) so a stuck connect fails fast, and each socket read may take up
+    to ``timeout`` seconds. Waiting for a free pooled connection is only
+    bounded by the total budget.
+    """
 
     def __init__(self, host: str, timeout: int = 5) -> None:
         """Initialise."""
         self.host = host
-        self.api_url = f"http://{host}/cgi-bin/EpvCgi"
-        self.timeout = ClientTimeout(total=timeout)
+        self.api_url = f"http://{host}{_CGI_PATH}"
+        self.timeout = ClientTimeout(
+            total=timeout,
+            sock_connect=min(2, timeout),
+            sock_read=timeout
+        )
+        self._session: aiohttp.ClientSession | None = None
+        # Queue requests here rather than in the connector pool, so waiting
+        # for a free connection does not count against the request timeout
+        self._slots = asyncio.Semaphore(_MAX_CONNECTIONS)
+
+    async def __aenter__(self) -> "API":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the async context manager and close the session."""
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=f"http://{self.host}",
+                timeout=self.timeout,
+                # The pump is a single LAN host with a static address
+                connector=aiohttp.TCPConnector(
+                    limit=_MAX_CONNECTIONS, limit_per_host=_MAX_CONNECTIONS,
+                    ttl_dns_cache=3600, keepalive_timeout=60, force_close=False
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def utc_now(self) -> int:
-        utc_now = math.floor(datetime.now(timezone.utc).timestamp() * 1000)
-        return utc_now
+        """Return the current UTC time in milliseconds."""
+        return _utc_now_ms()
+
+    async def _request(self, method: str, name: str, val: Any = 0, action: str = "get") -> tuple[int, bytes]:
+        """Send a request to the pump and return the status and raw body."""
+        async with self._slots:
+            # yarl rejects bool query values, so send val as text like the old URLs did
+            params = {"name": name, "val": str(val), "type": action, "time": _utc_now_ms()}
+            try:
+                session = await self._get_session()
+                async with session.request(method, _CGI_PATH, params=params) as response:
+                    return response.status, await _read_small(response)
+            except aiohttp.ClientError as err:
+                raise APIConnectionError("Timeout connecting to api") from err
+
+    async def _fetch(self, name: str) -> bytes:
+        """Get the raw JSON body for a named value."""
+        _, body = await self._request("GET", name)
+        return body
 
     async def get_data(self) -> EmauxPumpData:
         """Get api data."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}?name=AllRd&val=0&type=get&time={self.utc_now()}", timeout=self.timeout) as response:
-                    return EmauxPumpData.from_dict(await response.json())
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        return _from_json(EmauxPumpData, await self._fetch("AllRd"))
 
     async def set_speed(self, speed: int) -> bool:
         """Set the pump speed."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.api_url}?name=SetCurrentSpeed&val={speed}&type=set&time={self.utc_now()}", timeout=self.timeout) as response:
-                    _LOGGER.debug("Pump speed set to %s, status code: %s", speed, response.status)
-                    return (response.status == 200) and (await response.json() == {"SetCurrentSpeed": speed})
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        status, body = await self._request("POST", "SetCurrentSpeed", speed, "set")
+        _LOGGER.debug("Pump speed set to %s, status code: %s", speed, status)
+        return (status == 200) and _expect_echo(body, "SetCurrentSpeed", speed)
 
     async def turn_on(self) -> bool:
         """Turn on the pump."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}?name=RunStop&val=1&type=set&time={self.utc_now()}", timeout=self.timeout) as response:
-                    _LOGGER.debug("Pump turned on, status code: %s", response.status)
-                    return (response.status == 200) and (await response.json() == {"RunStop": 1})
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        status, body = await self._request("GET", "RunStop", 1, "set")
+        _LOGGER.debug("Pump turned on, status code: %s", status)
+        return (status == 200) and _expect_echo(body, "RunStop", 1, _ECHO_ON)
 
     async def turn_off(self) -> bool:
         """Turn off the pump."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}?name=RunStop&val=2&type=set&time={self.utc_now()}", timeout=self.timeout) as response:
-                    _LOGGER.debug("Pump turned off, status code: %s", response.status)
-                    return (response.status == 200) and (await response.json() == {"RunStop": 2})
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        status, body = await self._request("GET", "RunStop", 2, "set")
+        _LOGGER.debug("Pump turned off, status code: %s", status)
+        return (status == 200) and _expect_echo(body, "RunStop", 2, _ECHO_OFF)
 
     async def get_settings(self) -> EmauxPumpSettings:
         """Get the pump settings."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}?name=AllWr&val=0&type=get&time={self.utc_now()}", timeout=self.timeout) as response:
-                    return EmauxPumpSettings.from_dict(await response.json())
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
-    
+        return _from_json(EmauxPumpSettings, await self._fetch("AllWr"))
+
+    async def get_all(self) -> EmauxData:
+        """Get the pump data and settings concurrently."""
+        pump_raw, settings_raw = await asyncio.gather(self._fetch("AllRd"), self._fetch("AllWr"))
+        return EmauxData(
+            pump=_from_json(EmauxPumpData, pump_raw),
+            settings=_from_json(EmauxPumpSettings, settings_raw)
+        )
+
+    async def _set_parameter(self, name: str, value: Any) -> bool:
+        """Send an already validated parameter to the pump."""
+        status, body = await self._request("POST", name, value, "set")
+        return (status == 200) and _expect_echo(body, name, value)
+
     async def set_parameter(self, name: str, value: Any) -> bool:
         """Set a parameter."""
-        if name not in VALID_PARAMETERS:
-            raise ValueError(f"Invalid parameter: {name}")
-        
-        param_range = VALID_PARAMETERS[name]
-        if isinstance(param_range, (list, set)):
-            if value not in param_range:
-                raise ValueError(f"Invalid value for {name}: {value}. Must be one of {param_range}")
-        elif isinstance(param_range, tuple):
-            min_val, max_val = param_range
-            if not min_val <= value <= max_val:
-                raise ValueError(f"Invalid value for {name}: {value}. Must be between {min_val} and {max_val}")
-        elif param_range is None:
-            if not isinstance(value, str):
-                raise ValueError(f"Invalid value for {name}: {value}. Must be a string")
-        else:
-            raise ValueError(f"Invalid parameter range definition for {name}")
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.api_url}?name={name}&val={value}&type=set&time={self.utc_now()}", timeout=self.timeout) as response:
-                    return (response.status == 200) and (await response.json() == {name: value})
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        _validate(name, value)
+        return await self._set_parameter(name, value)
+
+    async def set_parameters(self, params: dict[str, Any]) -> dict[str, bool]:
+        """Set several parameters concurrently.
+
+        Every value is validated before anything is sent, and requests go
+        out at most ``_MAX_CONNECTIONS`` at a time. If any request
+        fails, APIConnectionError is raised and the other results are lost,
+        even though those parameters may already have been applied.
+        """
+        for name, value in params.items():
+            _validate(name, value)
+        results = await asyncio.gather(*(self._set_parameter(name, value) for name, value in params.items()))
+        return dict(zip(params, results))
 
     async def get_parameter(self, name: str) -> dict:
         """Get a parameter."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}?name={name}&val=0&type=get&time={self.utc_now()}", timeout=self.timeout) as response:
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise APIConnectionError("Timeout connecting to api") from err
+        return orjson.loads(await self._fetch(name))
 
 class APIConnectionError(Exception):
     """Exception class for connection error."""
\ No newline at end of file
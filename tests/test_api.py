@@ -1,23 +1,39 @@
 from src.api import API
 
 async def test_get_data():
-    api = API("192.168.1.54")
-    data = await api.get_data()
-    assert data is not None
+    async with API("192.168.1.54") as api:
+        data = await api.get_data()
+        assert data is not None
 
 async def test_set_speed():
-    api = API("192.168.1.54")
-    assert await api.set_speed(1500)
+    async with API("192.168.1.54") as api:
+        assert await api.set_speed(1500)
 
 async def test_turn_on():
-    api = API("192.168.1.54")
-    assert await api.turn_on()
+    async with API("192.168.1.54") as api:
+        assert await api.turn_on()
 
 async def test_turn_off():
-    api = API("192.168.1.54")
-    assert await api.turn_off()
+    async with API("192.168.1.54") as api:
+        assert await api.turn_off()
 
 async def test_get_schedules():
-    api = API("192.168.1.54")
-    schedules = await api.get_schedules()
-    assert schedules is not None
+    async with API("192.168.1.54") as api:
+        schedules = await api.get_schedules()
+        assert schedules is not None
+
+async def test_get_all():
+    async with API("192.168.1.54") as api:
+        data = await api.get_all()
+        assert data.pump is not None
+        assert data.settings is not None
+
+async def test_set_parameters():
+    async with API("192.168.1.54") as api:
+        settings = await api.get_settings()
+        original = {"Speed1": settings.speeds[0], "Speed1Title": settings.speed_titles[0]}
+        try:
+            results = await api.set_parameters({"Speed1": 1500, "Speed1Title": "Filter"})
+            assert all(results.values())
+        finally:
+            assert all((await api.set_parameters(original)).values())
@@ -0,0 +1,75 @@
+import asyncio
+import gzip
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import pytest
+
+from src.api import API, APIConnectionError
+
+class FakePump:
+    """Minimal keep-alive HTTP server that echoes pump requests."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.connections = 0
+        self.requests = []
+
+    async def __aenter__(self) -> "FakePump":
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.host = "127.0.0.1:%d" % self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                query = parse_qs(urlsplit(head.split(b" ", 2)[1].decode()).query)
+                name, val = query["name"][0], query["val"][0]
+                self.requests.append((name, val))
+                await asyncio.sleep(self.delay)
+                body = orjson.dumps({name: int(val) if val.isdigit() else val})
+                if name == "Short":
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % (len(body) + 10) + body)
+                    await writer.drain()
+                    return
+                headers = b""
+                if name == "Gzip":
+                    body = gzip.compress(body)
+                    headers = b"Content-Encoding: gzip\r\n"
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n%s\r\n" % (len(body), headers) + body)
+                await writer.drain()
+        finally:
+            writer.close()
+
+async def test_read_small_reuses_connection():
+    async with FakePump() as pump, API(pump.host) as api:
+        assert await api.get_parameter("RunStop") == {"RunStop": 0}
+        assert await api.get_parameter("Reset") == {"Reset": 0}
+        assert pump.connections == 1
+
+async def test_read_small_compressed_body():
+    async with FakePump() as pump, API(pump.host) as api:
+        assert await api.get_parameter("Gzip") == {"Gzip": 0}
+
+async def test_read_small_truncated_body():
+    async with FakePump() as pump, API(pump.host) as api:
+        with pytest.raises(APIConnectionError):
+            await api.get_parameter("Short")
+        assert await api.get_parameter("RunStop") == {"RunStop": 0}
+        assert await api.get_parameter("Reset") == {"Reset": 0}
+        assert pump.connections == 2
+
+async def test_set_parameters_larger_than_pool():
+    params = {f"Sch{i}TimeOn{unit}": 1 for i in range(1, 5) for unit in ("Hour", "Min")}
+    async with FakePump(delay=0.4) as pump, API(pump.host, timeout=1) as api:
+        assert await api.set_parameters(params) == dict.fromkeys(params, True)
+        assert len(pump.requests) == len(params)
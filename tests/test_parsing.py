@@ -0,0 +1,134 @@
+import re
+
+import orjson
+import pytest
+
+from src.api import (
+    _ECHO_OFF, _ECHO_ON, API, APIConnectionError, EmauxPumpData, EmauxPumpSettings, _build_validator,
+    _expect_echo, _from_json, _validate
+)
+
+ALL_RD = {
+    "CurrentTime": "12:30", "CurrentSpeed": "1500", "CurrentWatts": "210", "RunningStatus": "1",
+    "FaultFlag": "0", "FaultCode": "E0", "SpeedSelected": "2", "CurrentTemperuture": "21",
+    "FreeModeStatus": "0", "CurrentSchedule": "3", "CurrentGPM": "40", "SpeedCount": "4",
+    "ScheduleCount": "4", "Model": "SPV150"
+}
+
+ALL_WR = {
+    "CurrentMin": "30", "CurrentHour": "12", "RunStop": "1", "SetCurrentSpeed": "1500",
+    "SetSpeedSelected": "2", "Language": "0", "LangSel": "en", "Frozen_Enable": "1",
+    "Frozen_LastingTime": "2", "Frozen_Speed": "1400", "Frozen_Temperature": "4",
+    "WifiSetToDefault": "0", "Reset": "0"
+}
+for i in range(1, 5):
+    ALL_WR.update({
+        f"Speed{i}": str(1000 + i), f"Speed{i}Title": f"Speed {i}", f"Sch{i}En": str(i % 2),
+        f"Sch{i}TimeOnHour": str(i), f"Sch{i}TimeOnMin": str(10 + i), f"Sch{i}TimeOffHour": str(12 + i),
+        f"Sch{i}TimeOffMin": str(20 + i), f"Sch{i}SpeedSelect": str(5 - i), f"SchTitle{i}": f"Schedule {i}"
+    })
+
+def test_expect_echo_compact():
+    assert _expect_echo(b'{"RunStop":1}', "RunStop", 1)
+    assert _expect_echo(b'{"Speed1Title":"Pool"}', "Speed1Title", "Pool")
+
+def test_expect_echo_whitespace():
+    assert _expect_echo(b'{"RunStop": 1}\n', "RunStop", 1)
+    assert _expect_echo(b'{ "Speed1Title" : "Pool" }', "Speed1Title", "Pool")
+
+def test_expect_echo_mismatch():
+    assert not _expect_echo(b'{"RunStop":12}', "RunStop", 1)
+    assert not _expect_echo(b'{"RunStop":1,"Reset":1}', "RunStop", 1)
+    assert not _expect_echo(b'not json', "RunStop", 1)
+
+def check_pump_data(data):
+    assert data.current_time == "12:30"
+    assert data.current_speed == 1500
+    assert data.running_status is True
+    assert data.free_mode_status is False
+    assert data.fault_code == "E0"
+    assert data.current_temperature == 21
+    assert data.model == "SPV150"
+
+def check_pump_settings(settings):
+    assert settings.run_stop is True
+    assert settings.frozen_enable is True
+    assert settings.reset is False
+    assert settings.frozen_speed == 1400
+    assert settings.lang_sel == "en"
+    assert settings.speeds == [1001, 1002, 1003, 1004]
+    assert settings.speed_titles == ["Speed 1", "Speed 2", "Speed 3", "Speed 4"]
+    assert [s.enabled for s in settings.schedules] == [True, False, True, False]
+    assert [s.time_on_min for s in settings.schedules] == [11, 12, 13, 14]
+    assert [s.speed_select for s in settings.schedules] == [4, 3, 2, 1]
+    assert [s.title for s in settings.schedules] == ["Schedule 1", "Schedule 2", "Schedule 3", "Schedule 4"]
+
+def test_pump_data_from_dict():
+    check_pump_data(EmauxPumpData.from_dict(ALL_RD))
+
+def test_pump_data_from_json():
+    data = EmauxPumpData.from_json(orjson.dumps(ALL_RD))
+    check_pump_data(data)
+    assert data == EmauxPumpData.from_dict(ALL_RD)
+
+def test_pump_settings_from_dict():
+    check_pump_settings(EmauxPumpSettings.from_dict(ALL_WR))
+
+def test_pump_settings_from_json():
+    settings = EmauxPumpSettings.from_json(orjson.dumps(ALL_WR))
+    check_pump_settings(settings)
+    assert settings == EmauxPumpSettings.from_dict(ALL_WR)
+
+def test_builders_agree_on_loose_values():
+    payload = dict(ALL_RD, FaultCode=0, Model=123, CurrentTime=1234, RunningStatus="", FreeModeStatus=1)
+    data = EmauxPumpData.from_json(orjson.dumps(payload))
+    assert data == EmauxPumpData.from_dict(payload)
+    assert data.fault_code == 0
+    assert data.running_status is False
+    assert data.free_mode_status is False
+
+def test_from_json_bad_payload():
+    with pytest.raises(APIConnectionError):
+        _from_json(EmauxPumpData, b'{"CurrentTime": "12:30"}')
+    with pytest.raises(APIConnectionError):
+        _from_json(EmauxPumpData, b"not json")
+
+def test_expect_echo_precomputed():
+    assert _expect_echo(b'{"RunStop":1}', "RunStop", 1, _ECHO_ON)
+    assert _expect_echo(b'{"RunStop": 2}', "RunStop", 2, _ECHO_OFF)
+    assert not _expect_echo(b'{"RunStop":2}', "RunStop", 1, _ECHO_ON)
+
+def test_validate_accepts_valid_values():
+    _validate("Language", 0)
+    _validate("Language", 6)
+    _validate("LangSel", "en")
+    _validate("Speed1Title", "Pool")
+    _validate("SetCurrentSpeed", 3400)
+
+@pytest.mark.parametrize("name, value, message", [
+    ("Language", 7, "Must be between 0 and 6"),
+    ("SetCurrentSpeed", 799, "Must be between 800 and 3400"),
+    ("LangSel", "xx", "Must be one of ['cn', 'de', 'en', 'es', 'fr', 'it', 'ru']"),
+    ("Speed1Title", 3, "Must be a string"),
+    ("Nope", 1, "Invalid parameter: Nope"),
+])
+def test_validate_rejects_invalid_values(name, value, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        _validate(name, value)
+
+def test_build_validator_unknown_tag():
+    with pytest.raises(ValueError, match="Invalid parameter range definition for Bogus"):
+        _build_validator("Bogus", ("bogus",))
+
+async def test_set_parameters_validates_before_sending():
+    api = API("127.0.0.1")
+    sent = []
+
+    async def request(*args):
+        sent.append(args)
+        return 200, b"{}"
+
+    api._request = request
+    with pytest.raises(ValueError):
+        await api.set_parameters({"Speed1": 1500, "Speed2": 10})
+    assert sent == []